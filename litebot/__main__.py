@@ -1,7 +1,17 @@
 from .litebot import LiteBot
 from .core.components import DiscordComponents
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop isn't available on Windows, fall back to the default asyncio loop
+    uvloop = None
+
 def main():
+    # The policy must be set before the bot grabs its event loop
+    if uvloop is not None:
+        uvloop.install()
+
     bot_instance = LiteBot()
     DiscordComponents(bot_instance)
     bot_instance.start_server()
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import inspect
+import types
+from functools import lru_cache
 from typing import List, Callable, Any, Optional, get_type_hints, get_args, Union, Type, TYPE_CHECKING
 
 from litebot.core.minecraft.commands.arguments import ArgumentType, Suggester
 from litebot.core.minecraft.commands.context import ServerCommandContext
 from litebot.errors import ArgumentError
+from litebot.utils import json_utils
 
 if TYPE_CHECKING:
     from litebot.core import Setting, Cog
@@ -14,54 +17,102 @@ if TYPE_CHECKING:
     from litebot.litebot import LiteBot
 
 
+@lru_cache(maxsize=256)
+def _cached_generic_args(tp: Any) -> tuple:
+    return get_args(tp)
+
+
+@lru_cache(maxsize=None)
+def _is_arg_type(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, ArgumentType)
+
+
+@lru_cache(maxsize=None)
+def _is_suggester(tp: Any) -> bool:
+    return isinstance(tp, type) and issubclass(tp, Suggester)
+
+
+def clear_arg_caches() -> None:
+    """Clear the caches used when building server command arguments.
+
+    Should be called when a plugin is unloaded, so that the caches don't keep its argument types alive.
+    """
+    _cached_generic_args.cache_clear()
+    _is_arg_type.cache_clear()
+    _is_suggester.cache_clear()
+
+
 class ServerCommand:
+    __slots__ = ("name", "callback", "help_msg", "_cog", "_bound_callback", "parent", "_full_path_parts", "full_name",
+                 "root_parent", "_register", "_op_level", "checks", "requirements", "arguments", "suggestors",
+                 "arg_types", "subs", "_built", "_built_json", "__setting__")
     __setting__: Setting
 
     def __init__(self, func: Callable, cog: Optional[Cog] = None, **kwargs):
         if not asyncio.iscoroutinefunction(func):
             raise TypeError("Callback must be a coroutine")
 
+        self._built: Optional[dict[str, Union[str, int, list, dict]]] = None
+        self._built_json: Optional[str] = None
+
         self.name = kwargs.get("name") or func.__name__
         self.callback = func
+        self.help_msg: Optional[str] = inspect.getdoc(func)
         self.cog = cog  # Will be set manually when adding the cog
 
-        self.parent = kwargs.get("parent")
+        self.parent: Optional[ServerCommand] = kwargs.get("parent")
+        # Commands never move in the tree, so resolve their position once
+        self._full_path_parts: tuple[str, ...] = (self.parent._full_path_parts if self.parent else ()) + (self.name,)
+        self.full_name: str = ".".join(self._full_path_parts)
+        self.root_parent: ServerCommand = self.parent.root_parent if self.parent else self
         self.register = bool(kwargs.get("register")) if kwargs.get("register") is not None else True
         self.op_level = kwargs.get("op_level") or 0
         self.checks: list[Callable] = []
         self.requirements: list[Callable] = []
 
         self.arguments, self.suggestors, self.arg_types = self._build_args(func)
-        self.subs: dict[str, ServerCommand] = {}
+        # Most commands are leaves, so the dict is only allocated once a sub is registered
+        self.subs: Optional[dict[str, ServerCommand]] = None
 
     @property
-    def help_msg(self) -> Optional[str]:
+    def cog(self) -> Optional[Cog]:
         """
         Returns:
-            The help message for the command
+            The cog that the command belongs to
         """
-        return inspect.getdoc(self.callback)
+        return self._cog
+
+    @cog.setter
+    def cog(self, value: Optional[Cog]) -> None:
+        self._cog = value
+        # Bind the cog now rather than checking for it on every invocation
+        self._bound_callback = types.MethodType(self.callback, value) if value else self.callback
 
     @property
-    def full_name(self) -> str:
+    def register(self) -> bool:
         """
         Returns:
-            The full name of the command
+            Whether the command will be registered on the server
         """
-        return ".".join(self._get_full_path()[::-1])
+        return self._register
+
+    @register.setter
+    def register(self, value: bool) -> None:
+        self._register = value
+        self._invalidate_build()
 
     @property
-    def root_parent(self) -> ServerCommand:
+    def op_level(self) -> int:
         """
         Returns:
-            The highest level parent of the command
+            The OP level required to run the command
         """
-        cmd = self
-
-        while cmd.parent is not None:
-            cmd = cmd.parent
+        return self._op_level
 
-        return cmd
+    @op_level.setter
+    def op_level(self, value: int) -> None:
+        self._op_level = value
+        self._invalidate_build()
 
     def build(self) -> Optional[dict[str, Union[str, int, list, dict]]]:
         """Build the command to send to the server.
@@ -95,15 +146,29 @@ class ServerCommand:
         if not self.register:
             return
 
-        data = {"name": self.name, "OPLevel": self.op_level, "arguments": self.arguments, "full": self.full_name}
-        subs = []
+        if self._built is None:
+            self._built = {
+                "name": self.name,
+                "OPLevel": self.op_level,
+                "arguments": self.arguments,
+                "full": self.full_name,
+                "subs": [sub.build() for sub in self.subs.values()] if self.subs else []
+            }
 
-        for sub in self.subs.values():
-            subs.append(sub.build())
+        return self._built
 
-        data["subs"] = subs
+    def build_json(self) -> str:
+        """Build the command and serialize it to JSON.
 
-        return data
+        See `build`.
+
+        Returns:
+            The serialized command that will be sent to the server.
+        """
+        if self._built_json is None:
+            self._built_json = json_utils.dumps(self.build())
+
+        return self._built_json
 
     def update_cog_ref(self, cog: Cog) -> None:
         """Update the command's reference to the cog
@@ -141,7 +206,11 @@ class ServerCommand:
 
         def decorator(func) -> ServerCommand:
             sub_command = ServerCommand(func, parent=self, **kwargs)
+            if self.subs is None:
+                self.subs = {}
+
             self.subs[sub_command.name] = sub_command
+            self._invalidate_build()
 
             return sub_command
 
@@ -164,10 +233,7 @@ class ServerCommand:
 
         args = data.get("args", {})
         for arg in self.arguments:
-            cmd_args[arg["name"]] = (args.get(arg["name"]))
-
-            if args.get(arg["name"]):
-                del args[arg["name"]]
+            cmd_args[arg["name"]] = args.pop(arg["name"], None)
 
         ctx = ServerCommandContext(self, server, bot, data["player"], args=cmd_args, full_args=full_args)
         return ctx
@@ -179,18 +245,15 @@ class ServerCommand:
             ctx: The context to invoke the command with
             args: The arguments that were provided for the command
         """
-        if self.cog:
-            await self.callback(self.cog, ctx, *args)
-        else:
-            await self.callback(ctx, *args)
+        await self._bound_callback(ctx, *args)
 
-    def _get_full_path(self) -> list[str]:
-        res = [self.name]
-
-        if self.parent:
-            res.extend(self.parent._get_full_path())
+    def _invalidate_build(self) -> None:
+        cmd = self
 
-        return res
+        while cmd is not None:
+            cmd._built = None
+            cmd._built_json = None
+            cmd = cmd.parent
 
     def _build_args(self, func: Callable) -> Union[tuple[list, dict, list], tuple[
         list[dict[str, Union[bool, Any]]], dict[Any, Type[Suggester]], dict[Any, Type[ArgumentType]]]]:
@@ -204,10 +267,10 @@ class ServerCommand:
         started_optional = False
 
         for arg_name, arg_type in arg_hints.items():
-            generic_args = get_args(arg_type)
+            generic_args = _cached_generic_args(arg_type)
             arg_type = generic_args[0] if generic_args else arg_type
 
-            if not issubclass(arg_type, ArgumentType) or (started_optional and not generic_args):
+            if not _is_arg_type(arg_type) or (started_optional and not generic_args):
                 raise ArgumentError("Invalid arguments for server command!")
 
             if generic_args:
@@ -216,7 +279,7 @@ class ServerCommand:
             args.append({"name": arg_name, "type": arg_type.REPR, "optional": started_optional})
             arg_types[arg_name] = arg_type
 
-            if issubclass(arg_type, Suggester):
+            if _is_suggester(arg_type):
                 suggestors[arg_name] = arg_type
 
         return args, suggestors, arg_types
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 import abc
-import json
 from typing import TYPE_CHECKING, Optional
 
 from litebot.core.minecraft import Player
 from litebot.core.minecraft.text import Text
+from litebot.utils import json_utils
 
 if TYPE_CHECKING:
     from litebot.core.minecraft.commands import ServerCommand
@@ -40,7 +40,7 @@ class ServerCommandContext(ServerContext):
         self.cog = command.cog
         self.args = kwargs["args"]
         self.full_args = kwargs["full_args"]
-        self.player = Player(**json.loads(player_data))
+        self.player = Player(**json_utils.loads(player_data))
         self.after_invoke_args = {}
 
     @property
@@ -106,7 +106,7 @@ class ServerEventContext(ServerContext):
 
     def __init__(self, server: MinecraftServer, bot: LiteBot, player_data: Optional[str] = None):
         super().__init__(server, bot)
-        self.player = Player(**json.loads(player_data)) if player_data else None
+        self.player = Player(**json_utils.loads(player_data)) if player_data else None
         self.setting: Optional[Setting] = None
 
     def with_setting(self, event):
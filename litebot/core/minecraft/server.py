@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import os
 from pathlib import Path
 from socket import timeout, gaierror, gethostbyname
@@ -12,6 +11,7 @@ from discord.errors import NotFound
 from websockets import WebSocketCommonProtocol
 
 from litebot.errors import ServerConnectionFailed, ServerNotFound, ServerNotRunningCarpet
+from litebot.utils import json_utils
 from .rpc import rpc
 from .commands.context import ServerEventContext, RPCContext
 from .commands.payload import Payload
@@ -250,7 +250,7 @@ class MinecraftServer:
                     return await self.send_message(Text.error_message("You are not authorized to run this command!"))
 
             await ctx.invoke()
-            await self._server_connection.send(json.dumps({
+            await self._server_connection.send(json_utils.dumps({
                 "name": "server_command_after_invoke",
                 "data": {"name": data["name"], "args": ctx.after_invoke_args}
             }))
@@ -311,12 +311,10 @@ class MinecraftServer:
                 continue
 
             if all([await r(self.bot_instance, self) for r in s.requirements]):
-                data.append(s.build())
+                data.append(s.build_json())
 
-        await self._server_connection.send(json.dumps({
-            "name": "server_command_registers",
-            "data": data
-        }))
+        # The commands are already serialized, so splice them in rather than encoding the tree again
+        await self._server_connection.send(f'{{"name": "server_command_registers", "data": [{",".join(data)}]}}')
 
     async def send_command(self, command: str) -> Optional[str]:
         """Executes a command on the server
@@ -396,5 +394,5 @@ class MinecraftServer:
         if player:
             payload["player"] = player.uuid
 
-        await self._server_connection.send(json.dumps({"name": "message", "data": payload}))
+        await self._server_connection.send(json_utils.dumps({"name": "message", "data": payload}))
 
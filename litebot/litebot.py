@@ -1,4 +1,6 @@
-import asyncio
+import threading
+import time
+from collections import defaultdict
 from datetime import datetime
 from typing import Callable, Union
 
@@ -6,6 +8,8 @@ import discord
 import os
 
 import mongoengine
+import pymongo
+import pymongo.errors
 from discord.ext import commands
 from discord.ext.commands import Command
 from sanic import Sanic
@@ -14,19 +18,23 @@ from sanic_cors import CORS
 
 from litebot.core.context import Context
 from litebot.core.cog import Cog
-from litebot.core.minecraft.commands.action import ServerCommand
+from litebot.core.minecraft.commands.action import ServerCommand, clear_arg_caches
 from litebot.core.plugins import PluginManager, Plugin
 from litebot.core.settings import SettingsManager
 from litebot.utils.tracking_model import TrackedEvent
 from litebot.server import APP_NAME, SERVER_HOST, SERVER_PORT, add_routes
+from litebot.utils import json_utils
 from litebot.utils.config import MainConfig
 from litebot.utils.logging import get_logger, set_logger, set_access_logger
 from litebot.core.minecraft.server import MinecraftServer, ServerContainer
 
+# The longest the timer thread will sleep, so that newly tracked events are picked up
+TIMER_POLL_INTERVAL = 5
+
 class GroupMixin(commands.GroupMixin):
     def __init__(self):
         self.server_commands: dict[str, ServerCommand] = {}
-        self.server_events: dict[str, list[Callable]] = {}
+        self.server_events: defaultdict[str, list[Callable]] = defaultdict(list)
         self.rpc_handlers: dict[str, Callable] = {}
 
     def add_command(self, command: Union[ServerCommand, Command]):
@@ -35,7 +43,8 @@ class GroupMixin(commands.GroupMixin):
         Args:
             command: The command to add
         """
-        if not isinstance(command, ServerCommand):
+        # Most commands are plain ServerCommands, so check the exact type before walking the MRO
+        if type(command) is not ServerCommand and not isinstance(command, ServerCommand):
             return super().add_command(command)
 
         self.server_commands[command.full_name] = command
@@ -46,11 +55,9 @@ class GroupMixin(commands.GroupMixin):
         Args:
             name: The name of the command to remove
         """
-        if name not in self.server_commands:
+        if self.server_commands.pop(name, None) is None:
             return super().remove_command(name)
 
-        self.server_commands.pop(name)
-
     def add_rpc_handler(self, handler, name):
         """Add an RPC method
 
@@ -76,10 +83,7 @@ class GroupMixin(commands.GroupMixin):
             func: The listener for the event
             name: The name of the handler
         """
-        if name in self.server_events:
-            return self.server_events[name].append(func)
-
-        self.server_events[name] = [func]
+        self.server_events[name].append(func)
 
     def remove_server_listener(self, func, name):
         """Remove a server listener
@@ -88,7 +92,16 @@ class GroupMixin(commands.GroupMixin):
             func: The listener to remove
             name: The name of the listner
         """
-        self.server_events[name] = list(filter(lambda e: e is not func, self.server_events[name]))
+        listeners = self.server_events[name]
+
+        # Compare by equality, cogs pass a freshly bound method that is never the registered object
+        for i, listener in enumerate(listeners):
+            if listener == func:
+                del listeners[i]
+                break
+
+        if not listeners:
+            del self.server_events[name]
 
 class LiteBot(GroupMixin, commands.Bot):
     VERSION = "3.0.1"
@@ -111,11 +124,15 @@ class LiteBot(GroupMixin, commands.Bot):
         self.logger.info("Connected to Mongo Database")
 
         self.processing_plugin = None
+        # Resolved in `on_ready`, once the discord cache is populated
+        self._log_channel = None
+        self._main_guild = None
 
         self.using_lta = bool(os.environ.get("USING_LTA"))
-        self.__server = Sanic(APP_NAME)
+        self.__server = Sanic(APP_NAME, dumps=json_utils.dumps)
         self.servers = self._init_servers()
-        self.loop.create_task(asyncio.to_thread(self._dispatch_timers))
+        # The timer loop never returns, so give it its own thread rather than holding one of the executor's
+        threading.Thread(target=self._dispatch_timers, name="timer-dispatch", daemon=True).start()
 
     @property
     def log_channel(self) -> discord.TextChannel:
@@ -123,7 +140,7 @@ class LiteBot(GroupMixin, commands.Bot):
         Returns:
             The log channel for the bot
         """
-        return self.get_channel(self.config["log_channel_id"])
+        return self._log_channel or self.get_channel(self.config["log_channel_id"])
 
     @property
     def server(self):
@@ -138,8 +155,11 @@ class LiteBot(GroupMixin, commands.Bot):
         Returns:
             The main guild object for the server
         """
-        await self.wait_until_ready()
-        return self.get_guild(self.config["main_guild_id"])
+        if self._main_guild is None:
+            await self.wait_until_ready()
+            self._main_guild = self.get_guild(self.config["main_guild_id"])
+
+        return self._main_guild
 
     async def get_context(self, message, *, cls=Context):
         return await super().get_context(message, cls=cls)
@@ -173,10 +193,15 @@ class LiteBot(GroupMixin, commands.Bot):
         self.processing_plugin = plugin
         super().unload_extension(plugin.path)
 
+        # Drop cached argument types so we don't keep the unloaded plugin's modules alive
+        clear_arg_caches()
+
     async def on_ready(self):
         """
         on_ready logger
         """
+        self._log_channel = self.get_channel(self.config["log_channel_id"])
+        self._main_guild = self.get_guild(self.config["main_guild_id"])
         self.logger.info(f"{self.user.name} is now online!")
 
     def start_server(self):
@@ -215,15 +240,40 @@ class LiteBot(GroupMixin, commands.Bot):
         return self.loop.create_task(wrapped, name=f"discord.py: {event_name}")
 
     def _dispatch_timers(self):
-        while True:
-            events = TrackedEvent.objects()
-            for event in events:
-                if not event.expire_time:
-                    continue
-
-                if datetime.utcnow() >= event.expire_time:
-                    name = f"{event.event_tag}_expire"
-                    self.dispatch(name, event)
-
-                    event.delete()
+        indexed = False
 
+        while True:
+            timeout = TIMER_POLL_INTERVAL
+
+            try:
+                # Skip the ODM for the polling queries, only the expired events need to become documents.
+                # The collection is cached on the class after the first successful call.
+                collection = TrackedEvent._get_collection()
+                if not indexed:
+                    # `_get_collection` caches the collection before building the indexes, so a failed first
+                    # call would never retry them
+                    TrackedEvent.ensure_indexes()
+                    indexed = True
+
+                now = datetime.utcnow()
+                expired = list(collection.find({"expire_time": {"$lte": now}}))
+
+                if expired:
+                    # Delete before dispatching, if this fails the events are retried rather than fired twice
+                    collection.delete_many({"_id": {"$in": [doc["_id"] for doc in expired]}})
+                    # `dispatch` schedules tasks on the loop, which isn't thread safe, so hand over the batch at once
+                    self.loop.call_soon_threadsafe(self._dispatch_expired, expired)
+
+                next_event = collection.find_one({"expire_time": {"$gt": now}}, {"expire_time": 1},
+                                                 sort=[("expire_time", pymongo.ASCENDING)])
+                if next_event:
+                    timeout = min(timeout, (next_event["expire_time"] - now).total_seconds())
+            except pymongo.errors.PyMongoError:
+                # Nothing else restarts this thread, so a dropped connection must not end it
+                self.logger.exception("Failed to dispatch tracked event timers")
+
+            time.sleep(max(0.1, timeout))
+
+    def _dispatch_expired(self, docs):
+        for doc in docs:
+            self.dispatch(f"{doc['event_tag']}_expire", TrackedEvent._from_son(doc))
@@ -1,11 +1,10 @@
-import json
-
 from sanic.request import Request
 
 from sanic import Blueprint
 from ..middlewares.jwt import validate_jwt
 
 from ...errors import AuthFailure, ServerNotFound
+from ...utils import json_utils
 
 blueprint = Blueprint("server", url_prefix="/server")
 
@@ -29,7 +28,7 @@ async def _websocket(request: Request, socket):
     """
     async for message in socket:
         try:
-            data: dict = json.loads(message)
+            data: dict = json_utils.loads(message)
             payload = validate_jwt(data["auth"], request.app.config.BOT_INSTANCE.config["api_secret"])
             server = request.app.config.BOT_INSTANCE.servers[payload["server_name"]]
 
@@ -38,9 +37,9 @@ async def _websocket(request: Request, socket):
             else:
                 res = await server.dispatch(payload["action"], data)
                 if res is not None:
-                    await socket.send(json.dumps({"id": data["auth"], "res": res}))
+                    await socket.send(json_utils.dumps({"id": data["auth"], "res": res}))
         except AuthFailure:
             await socket.close(reason="Invalid Authorization Token!")
-        except (KeyError, json.JSONDecodeError, ServerNotFound):
-            await socket.send(json.dumps({"error": "Invalid Data!"}))
+        except (KeyError, json_utils.JSONDecodeError, ServerNotFound):
+            await socket.send(json_utils.dumps({"error": "Invalid Data!"}))
 
@@ -0,0 +1,40 @@
+import json
+from json import JSONDecodeError
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, **kwargs) -> str:
+    """Serialize an object to a JSON string, using `orjson` when it is installed
+
+    Args:
+        obj: The object to serialize
+        **kwargs: Additional arguments for `json.dumps`. Anything other than `default`
+            isn't supported by `orjson`, so the stdlib is used instead
+
+    Returns:
+        The JSON string
+    """
+    if orjson is not None and kwargs.keys() <= {"default"}:
+        # Match the stdlib by stringifying non `str` keys instead of raising
+        return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+    return json.dumps(obj, **kwargs)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string, using `orjson` when it is installed
+
+    Args:
+        data: The JSON string to deserialize
+
+    Returns:
+        The deserialized object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
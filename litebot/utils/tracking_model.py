@@ -12,4 +12,6 @@ class TrackedEvent(Document):
     tracking_id = IntField(required=True, unique=True)
     event_tag = StringField(required=True)
     expire_time = DateTimeField()
-    extra_info = DictField()
\ No newline at end of file
+    extra_info = DictField()
+
+    meta = {"indexes": ["expire_time"]}